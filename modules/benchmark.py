@@ -0,0 +1,194 @@
+"""
+Helpers to time client-side hot paths and compare benchmark runs.
+
+Results are stored as JSON so runs can be diffed between commits. Timings of one
+run drift by 10-60% against the next on shared machines, so compare several runs of
+each commit (directories are expanded to their benchmark_*.json files):
+
+    python -m modules.benchmark compare --baseline reports/bench-main --current reports/benchmarks
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+DEFAULT_THRESHOLD = 0.2
+# A slowdown must also exceed this many standard deviations between baseline runs
+DEFAULT_SIGMAS = 3.0
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def _reference_workload() -> int:
+    return sum(index * index for index in range(500))
+
+
+def measure(
+    func: Callable[[], Any],
+    *,
+    rounds: int = 100,
+    warmup: int = 10,
+    inner: int = 1,
+    repeats: int = 5,
+) -> Dict[str, float]:
+    """
+    Call func `warmup` times, then time `rounds` batches of `inner` calls, split into
+    `repeats` consecutive groups. Returned statistics are seconds per single call.
+
+    Every round is paired with one run of a fixed pure-Python reference workload.
+    relative (median of round time / reference time) is what compare_results uses:
+    CPU frequency changes and noisy neighbours on shared runners slow both halves of
+    a pair alike, so the ratio stays put while absolute times drift between runs.
+    relative_stdev is the spread of that median across the repeat groups.
+
+    Like timeit, garbage collection is disabled while timing, so collections
+    triggered by allocation-heavy calls do not land in random rounds.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    ratios: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = perf_counter()
+            for _ in range(inner):
+                func()
+            middle = perf_counter()
+            _reference_workload()
+            end = perf_counter()
+            samples.append((middle - start) / inner)
+            ratios.append(samples[-1] / (end - middle))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    group = max(rounds // repeats, 1)
+    medians = [statistics.median(ratios[index:index + group]) for index in range(0, group * (rounds // group), group)]
+    return {
+        "rounds": rounds,
+        "inner": inner,
+        "repeats": len(medians),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "mean_s": statistics.fmean(samples),
+        "median_s": statistics.median(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "relative": statistics.median(ratios),
+        "relative_stdev": statistics.stdev(medians) if len(medians) > 1 else 0.0,
+    }
+
+
+def save_results(results: Iterable[Dict[str, Any]], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": sorted(results, key=lambda item: item["name"]),
+    }
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def load_results(path: Path) -> Results:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {item["name"]: item for item in payload.get("results", [])}
+
+
+def load_runs(paths: Iterable[Path]) -> List[Results]:
+    """
+    Load one result set per file; directories contribute their benchmark_*.json files
+    (not latest.json, which duplicates the newest of them).
+    """
+    runs: List[Results] = []
+    for path in map(Path, paths):
+        files = sorted(path.glob("benchmark_*.json")) if path.is_dir() else [path]
+        runs.extend(load_results(file) for file in files)
+    return runs
+
+
+def compare_results(
+    baseline: List[Results],
+    current: List[Results],
+    threshold: float = DEFAULT_THRESHOLD,
+    sigmas: float = DEFAULT_SIGMAS,
+) -> List[Dict[str, Any]]:
+    """
+    Compare several runs of the baseline commit with several runs of the current one
+    on the machine-speed-independent `relative` figure (see measure).
+
+    A benchmark regressed when its fastest current run is slower than its slowest
+    baseline run by more than its threshold (the entry's own "threshold" or
+    `threshold`; 0.2 == 20% slower), and slower than the baseline mean by more than
+    `sigmas` standard deviations between baseline runs. With a single baseline run
+    the within-run spread stands in, which underestimates noise between runs.
+    baseline_s/current_s in the result are the medians of the two runs compared.
+    """
+    names = {name for run in baseline for name in run} & {name for run in current for name in run}
+    regressions: List[Dict[str, Any]] = []
+    for name in sorted(names):
+        olds = [run[name] for run in baseline if name in run and run[name]["relative"] > 0]
+        news = [run[name] for run in current if name in run]
+        if not olds:
+            continue
+        old = max(olds, key=lambda item: item["relative"])
+        new = min(news, key=lambda item: item["relative"])
+        relatives = [item["relative"] for item in olds]
+        if len(relatives) > 1:
+            spread = statistics.stdev(relatives)
+        else:
+            spread = max(old["relative_stdev"], new["relative_stdev"])
+        limit = new.get("threshold", threshold)
+        change = (new["relative"] - old["relative"]) / old["relative"]
+        if change > limit and new["relative"] - statistics.fmean(relatives) > sigmas * spread:
+            regressions.append(
+                {"name": name, "baseline_s": old["median_s"], "current_s": new["median_s"], "change": change}
+            )
+    return regressions
+
+
+def format_regressions(regressions: List[Dict[str, Any]], threshold: float) -> str:
+    if not regressions:
+        return f"No benchmark regressed by more than {threshold:.0%}"
+    lines = [f"{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}:"]
+    for item in regressions:
+        lines.append(
+            f"  {item['name']}: {item['change']:+.0%} relative to reference "
+            f"(median {item['baseline_s'] * 1e6:.3f}us -> {item['current_s'] * 1e6:.3f}us)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m modules.benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare = subparsers.add_parser("compare", help="Compare runs of two commits")
+    compare.add_argument("--baseline", nargs="+", type=Path, required=True, help="Result files or directories")
+    compare.add_argument("--current", nargs="+", type=Path, required=True, help="Result files or directories")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare.add_argument("--sigmas", type=float, default=DEFAULT_SIGMAS)
+    args = parser.parse_args(argv)
+
+    baseline, current = load_runs(args.baseline), load_runs(args.current)
+    if not baseline or not current:
+        print("No benchmark results found", file=sys.stderr)
+        return 2
+    regressions = compare_results(baseline, current, args.threshold, args.sigmas)
+    print(f"Compared {len(current)} current run(s) against {len(baseline)} baseline run(s)")
+    print(format_regressions(regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -57,6 +57,7 @@ class TcLogger:
     def __init__(self, level: int = 100, logger_name: str = "TITLE"):
         self._level = level
         self._logger_name = logger_name
+        self._test_name: Optional[str] = None
         logging.addLevelName(self._level, self._logger_name)
 
     @classmethod
@@ -65,9 +66,18 @@ class TcLogger:
             cls.__logger = TcLogger()
         return cls.__logger
 
+    @property
+    def test_name(self) -> Optional[str]:
+        """Name passed to the last log_test_name call, attached to structured request logs."""
+        return self._test_name
+
     def log_test_name(self, test_name: str) -> None:
+        self._test_name = test_name
         logging.log(self._level, test_name)
 
+    def clear_test_name(self) -> None:
+        self._test_name = None
+
     @staticmethod
     def generate_logs(
         *,
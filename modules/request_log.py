@@ -0,0 +1,347 @@
+"""
+Structured request log: one compact JSON line per ApiClient request, rotated by size
+and gzip-compressed, plus an offline analyzer for the resulting files:
+
+    python -m modules.request_log analyze reports/requests --top 20
+"""
+
+import argparse
+import atexit
+import gzip
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from .logger import get_logger
+
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 10
+LOG_NAME = "requests"
+
+_logger = get_logger(__name__)
+_sinks: Dict[Path, "RequestLogSink"] = {}
+_sinks_lock = threading.Lock()
+
+
+def _default_name() -> str:
+    # pytest-xdist workers are separate processes; each one writes and rotates its own file
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"{LOG_NAME}-{worker}" if worker else LOG_NAME
+
+
+class RequestLogSink:
+    """
+    Append-only JSONL writer. When the active file would exceed max_bytes it is
+    renamed with a timestamp under the lock; compression and pruning of archives
+    beyond backup_count happen in a background thread so requests never wait on gzip.
+
+    Each line is a single unbuffered O_APPEND write and the size is read from the
+    file itself, so processes that still share a file (two pytest runs on one
+    directory) neither interleave lines nor miss each other's rotations.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        name: Optional[str] = None,
+    ) -> None:
+        self._directory = Path(directory).resolve()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._name = name or _default_name()
+        self._path = self._directory / f"{self._name}.jsonl"
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._compressors: List[threading.Thread] = []
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def backup_count(self) -> int:
+        return self._backup_count
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        with self._lock:
+            if self._fd is None or self._replaced():
+                self._open()
+            size = os.fstat(self._fd).st_size
+            if self._max_bytes and size and size + len(line) > self._max_bytes:
+                self._rotate()
+            os.write(self._fd, line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            compressors, self._compressors = self._compressors, []
+        for thread in compressors:
+            thread.join()
+
+    def _open(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _replaced(self) -> bool:
+        # Another process rotated the file: keep writing to the new one, not the renamed archive
+        try:
+            return os.stat(self._path).st_ino != os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            return True
+
+    def _rotate(self) -> None:
+        ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+        rotated = self._directory / f"{self._name}.{ts}.jsonl"
+        try:
+            os.replace(self._path, rotated)
+        except FileNotFoundError:
+            # Rotated by another process in the meantime
+            self._open()
+            return
+        self._open()
+
+        self._compressors = [thread for thread in self._compressors if thread.is_alive()]
+        thread = threading.Thread(target=self._compress, args=(rotated,), name="request-log-gzip", daemon=True)
+        self._compressors.append(thread)
+        thread.start()
+
+    def _compress(self, rotated: Path) -> None:
+        # Written under a temporary name so the analyzer and pruning never see a partial archive
+        partial = rotated.with_name(rotated.name + ".gz.partial")
+        with open(rotated, "rb") as source, gzip.open(partial, "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target)
+        os.replace(partial, rotated.with_name(rotated.name + ".gz"))
+        rotated.unlink()
+
+        with self._lock:
+            archives = sorted(self._directory.glob(f"{self._name}.*.jsonl.gz"))
+            for old in archives[: max(len(archives) - self._backup_count, 0)]:
+                old.unlink(missing_ok=True)
+
+
+def get_request_log_sink(
+    directory: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+) -> RequestLogSink:
+    """
+    Return the shared sink for a directory, so clients logging to the same place
+    do not rotate each other's files. The first caller's rotation settings win;
+    a later caller asking for different ones gets a warning.
+    """
+    key = Path(directory).resolve()
+    with _sinks_lock:
+        if key not in _sinks:
+            _sinks[key] = RequestLogSink(directory, max_bytes=max_bytes, backup_count=backup_count)
+        sink = _sinks[key]
+    if (sink.max_bytes, sink.backup_count) != (max_bytes, backup_count):
+        _logger.warning(
+            "Request log %s already uses max_bytes=%d, backup_count=%d; ignoring max_bytes=%d, backup_count=%d",
+            sink.path, sink.max_bytes, sink.backup_count, max_bytes, backup_count,
+        )
+    return sink
+
+
+def close_request_log_sinks() -> None:
+    with _sinks_lock:
+        for sink in _sinks.values():
+            sink.close()
+        _sinks.clear()
+
+
+atexit.register(close_request_log_sinks)
+
+
+# Analysis
+
+# Log-scale latency buckets (~2% wide) keep percentiles cheap and mergeable across files
+_BUCKET_BASE = 1.02
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36}|[0-9a-fA-F]{24})$")
+
+
+@lru_cache(maxsize=65536)
+def normalize_endpoint(url: str) -> str:
+    """
+    Drop the query string and replace id-like path segments with {id}.
+    """
+    path = url.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _bucket(ms: float) -> int:
+    return int(math.log(ms, _BUCKET_BASE)) + 1 if ms >= 1 else 0
+
+
+def _new_stats() -> Dict[str, Any]:
+    return {"count": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0, "buckets": {}}
+
+
+def _open_log(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8", buffering=1024 * 1024)
+
+
+def aggregate_file(path: Path) -> Dict[str, Dict[str, Any]]:
+    stats: Dict[str, Dict[str, Any]] = {}
+    loads = json.loads
+    with _open_log(path) as stream:
+        for line in stream:
+            try:
+                record = loads(line)
+            except ValueError:
+                continue
+            # normalize_endpoint is memoized (bounded), so repeated URLs skip the regex
+            key = f"{record.get('method')} {normalize_endpoint(record.get('url') or '')}"
+            item = stats.get(key)
+            if item is None:
+                item = stats[key] = _new_stats()
+            ms = record.get("ms") or 0.0
+            status = record.get("status")
+            item["count"] += 1
+            item["total_ms"] += ms
+            item["retries"] += record.get("retries") or 0
+            if ms > item["max_ms"]:
+                item["max_ms"] = ms
+            if status is None or status >= 400:
+                item["errors"] += 1
+            bucket = _bucket(ms)
+            item["buckets"][bucket] = item["buckets"].get(bucket, 0) + 1
+    return stats
+
+
+def merge_stats(target: Dict[str, Dict[str, Any]], source: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    for key, item in source.items():
+        merged = target.setdefault(key, _new_stats())
+        merged["count"] += item["count"]
+        merged["errors"] += item["errors"]
+        merged["retries"] += item["retries"]
+        merged["total_ms"] += item["total_ms"]
+        merged["max_ms"] = max(merged["max_ms"], item["max_ms"])
+        for bucket, count in item["buckets"].items():
+            merged["buckets"][bucket] = merged["buckets"].get(bucket, 0) + count
+    return target
+
+
+def _percentile(buckets: Dict[int, int], count: int, fraction: float) -> float:
+    rank = fraction * count
+    seen = 0
+    for bucket in sorted(buckets):
+        seen += buckets[bucket]
+        if seen >= rank:
+            return _BUCKET_BASE ** bucket if bucket else 1.0
+    return 0.0
+
+
+def summarize(stats: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = []
+    for endpoint, item in stats.items():
+        count = item["count"]
+        rows.append(
+            {
+                "endpoint": endpoint,
+                "count": count,
+                "error_rate": item["errors"] / count,
+                "retries": item["retries"],
+                "mean_ms": item["total_ms"] / count,
+                # Bucket upper bounds can overshoot the largest observed value
+                "p95_ms": min(_percentile(item["buckets"], count, 0.95), item["max_ms"]),
+                "max_ms": item["max_ms"],
+            }
+        )
+    return rows
+
+
+def find_log_files(paths: List[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.jsonl")) + sorted(path.glob("*.jsonl.gz")))
+        else:
+            files.append(path)
+    return files
+
+
+def analyze(paths: List[Path], jobs: int = 1) -> List[Dict[str, Any]]:
+    """
+    Aggregate per-endpoint statistics over plain and gzipped JSONL files. With
+    jobs > 1 files are parsed in parallel processes.
+    """
+    files = find_log_files(paths)
+    stats: Dict[str, Dict[str, Any]] = {}
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results: Iterator[Dict[str, Dict[str, Any]]] = pool.map(aggregate_file, files)
+            for result in results:
+                merge_stats(stats, result)
+    else:
+        for path in files:
+            merge_stats(stats, aggregate_file(path))
+    return summarize(stats)
+
+
+def format_report(rows: List[Dict[str, Any]], top: int) -> str:
+    header = f"{'endpoint':<60} {'count':>8} {'errors':>7} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}"
+
+    def table(title: str, selected: List[Dict[str, Any]]) -> List[str]:
+        lines = [title, header]
+        for row in selected:
+            lines.append(
+                f"{row['endpoint'][:60]:<60} {row['count']:>8} {row['error_rate']:>7.1%} "
+                f"{row['mean_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['max_ms']:>9.1f}"
+            )
+        return lines
+
+    total = sum(row["count"] for row in rows)
+    errors = sum(row["error_rate"] * row["count"] for row in rows)
+    lines = [f"{total} requests, {len(rows)} endpoints, error rate {errors / total if total else 0:.1%}", ""]
+    lines += table("Slowest endpoints (p95):", sorted(rows, key=lambda row: -row["p95_ms"])[:top])
+    lines.append("")
+    failing = [row for row in rows if row["error_rate"]]
+    lines += table("Highest error rates:", sorted(failing, key=lambda row: (-row["error_rate"], -row["count"]))[:top])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m modules.request_log")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    analyze_parser = subparsers.add_parser("analyze", help="Slowest endpoints and error rates from JSONL request logs")
+    analyze_parser.add_argument("paths", nargs="+", type=Path, help="Log files or directories")
+    analyze_parser.add_argument("--top", type=int, default=20)
+    analyze_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel file parsers")
+    analyze_parser.add_argument("--json", action="store_true", help="Print per-endpoint rows as JSON")
+    args = parser.parse_args(argv)
+
+    rows = analyze(args.paths, jobs=args.jobs)
+    if args.json:
+        print(json.dumps(sorted(rows, key=lambda row: -row["p95_ms"]), indent=2))
+    else:
+        print(format_report(rows, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+pytest plugin that records per-test durations and uses them to split the suite
+into balanced shards, running the longest tests first.
+
+Enabled from tests/conftest.py via ``pytest_plugins``:
+
+    pytest --shard-count 3 --shard-id 0      # run the first of three shards
+    pytest --timings-order                   # no sharding, just longest-first
+
+Each shard only records the tests it ran; write those to a per-shard file with
+--timings-output and combine them with the previous timings after all shards finish:
+
+    python -m modules.timings merge reports/test_timings.json shard-*.json -o reports/test_timings.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+
+DEFAULT_TIMINGS_FILE = os.path.join("reports", "test_timings.json")
+# Used for tests that have no recorded duration yet and nothing to estimate from
+DEFAULT_DURATION = 1.0
+
+
+def load_timings(path: Path) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {str(nodeid): float(seconds) for nodeid, seconds in data.get("durations", {}).items()}
+
+
+def save_timings(path: Path, durations: Dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"durations": {nodeid: round(seconds, 4) for nodeid, seconds in sorted(durations.items())}}
+    # Unique temp name: concurrent pytest processes sharing reports/ must not replace each other's file
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as stream:
+        stream.write(json.dumps(payload, indent=2))
+    os.replace(stream.name, path)
+
+
+def estimate_durations(nodeids: List[str], timings: Dict[str, float]) -> Dict[str, float]:
+    """
+    Return a duration for every nodeid; unknown tests get the median recorded duration.
+    """
+    default = statistics.median(timings.values()) if timings else DEFAULT_DURATION
+    return {nodeid: timings.get(nodeid, default) for nodeid in nodeids}
+
+
+def partition(durations: Dict[str, float], shard_count: int) -> List[List[str]]:
+    """
+    Split tests into `shard_count` shards with similar total duration (longest
+    processing time first). Each shard is ordered longest-first, and the result is
+    deterministic so every CI machine computes the same split.
+    """
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    totals = [0.0] * shard_count
+    for nodeid in sorted(durations, key=lambda key: (-durations[key], key)):
+        index = min(range(shard_count), key=lambda i: (totals[i], i))
+        shards[index].append(nodeid)
+        totals[index] += durations[nodeid]
+    return shards
+
+
+def _timings_path(config: pytest.Config) -> Path:
+    return Path(config.getoption("timings_file") or os.getenv("TIMINGS_FILE", DEFAULT_TIMINGS_FILE)).resolve()
+
+
+def _timings_output(config: pytest.Config) -> Path:
+    output = config.getoption("timings_output")
+    return Path(output).resolve() if output else _timings_path(config)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("timings", "duration-aware scheduling")
+    group.addoption(
+        "--timings-file",
+        default=None,
+        help=f"Recorded test durations (default: $TIMINGS_FILE or {DEFAULT_TIMINGS_FILE})",
+    )
+    group.addoption("--shard-count", type=int, default=1, help="Split the selected tests into N balanced shards")
+    group.addoption("--shard-id", type=int, default=0, help="Zero-based shard to run (with --shard-count)")
+    group.addoption("--timings-order", action="store_true", help="Run the longest recorded tests first")
+    group.addoption(
+        "--timings-output",
+        default=None,
+        help="Record durations of this run into a separate file (default: the --timings-file)",
+    )
+    group.addoption("--no-record-timings", action="store_true", help="Do not update the timings file")
+
+
+class TimingsRecorder:
+    """
+    Sums setup/call/teardown durations per test and merges them into the timings
+    file at the end of the session. Tests that did not run, including skipped ones,
+    keep their old value.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._durations: Dict[str, float] = {}
+        self._skipped: Set[str] = set()
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # A skip takes ~0s and would replace the real duration of a test that usually runs
+        if report.skipped:
+            self._skipped.add(report.nodeid)
+        self._durations[report.nodeid] = self._durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        durations = {nodeid: seconds for nodeid, seconds in self._durations.items() if nodeid not in self._skipped}
+        if not durations:
+            return
+        timings = load_timings(self._path)
+        timings.update(durations)
+        save_timings(self._path, timings)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    shard_count = config.getoption("shard_count")
+    shard_id = config.getoption("shard_id")
+    if shard_count < 1 or not 0 <= shard_id < shard_count:
+        raise pytest.UsageError(f"--shard-id must be in [0, {shard_count}) and --shard-count must be >= 1")
+    # xdist workers report their results to the controller, which records them once
+    if not config.getoption("no_record_timings") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(TimingsRecorder(_timings_output(config)), "timings-recorder")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    # trylast: -k/-m deselection has already happened, so shards split what will actually run
+    shard_count = config.getoption("shard_count")
+    if shard_count == 1 and not config.getoption("timings_order"):
+        return
+
+    durations = estimate_durations([item.nodeid for item in items], load_timings(_timings_path(config)))
+    by_nodeid = {item.nodeid: item for item in items}
+    shard = partition(durations, shard_count)[config.getoption("shard_id")]
+
+    selected = set(shard)
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = [by_nodeid[nodeid] for nodeid in shard]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m modules.timings")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge = subparsers.add_parser("merge", help="Merge timings files; later files win on conflicts")
+    merge.add_argument("files", nargs="+", type=Path)
+    merge.add_argument("-o", "--output", type=Path, default=Path(DEFAULT_TIMINGS_FILE))
+    args = parser.parse_args(argv)
+
+    timings: Dict[str, float] = {}
+    for path in args.files:
+        timings.update(load_timings(path))
+    save_timings(args.output, timings)
+    print(f"Merged {len(timings)} durations into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json as _json
+import os
+import time
 from typing import Any, Dict, Optional
 
 import requests
-from requests import Response
+from requests import PreparedRequest, Response
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
 from urllib3.util.retry import Retry
 
 from .config import ClientConfig
-from modules.logger import configure_logging, get_logger, redact_headers, log_timing
+from modules.logger import TcLogger, configure_logging, get_logger, redact_headers, log_timing
+from modules.request_log import RequestLogSink, get_request_log_sink
 
 
 _logger = get_logger(__name__)
@@ -35,6 +39,13 @@ class ApiClient:
             self._session.headers.update(config.default_headers)
         if config.api_key:
             self._session.headers.update({"Authorization": f"Bearer {config.api_key}"})
+        self._request_log: Optional[RequestLogSink] = None
+        if config.request_log_dir:
+            self._request_log = get_request_log_sink(
+                config.request_log_dir,
+                max_bytes=config.request_log_max_bytes,
+                backup_count=config.request_log_backup_count,
+            )
 
     def _url(self, path: str) -> str:
         if path.startswith("http://") or path.startswith("https://"):
@@ -64,18 +75,65 @@ class ApiClient:
             redact_headers({**self._session.headers, **request_headers} if self._session.headers else request_headers),
             _json.dumps(json)[:512] if json is not None else None,
         )
-        with log_timing(_logger, f"{method.upper()} {url}"):
-            response = self._session.request(
-                method=method.upper(),
-                url=url,
-                params=params,
-                json=json,
-                headers=request_headers or None,
-                timeout=timeout or self._config.timeout_seconds,
-                verify=self._config.verify_ssl,
-            )
+        start = time.perf_counter()
+        try:
+            with log_timing(_logger, f"{method.upper()} {url}"):
+                response = self._session.request(
+                    method=method.upper(),
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers=request_headers or None,
+                    timeout=timeout or self._config.timeout_seconds,
+                    verify=self._config.verify_ssl,
+                )
+        except requests.RequestException as exc:
+            if self._request_log:
+                # Exhausted retries surface as MaxRetryError wrapped by requests
+                exhausted = bool(exc.args) and isinstance(exc.args[0], MaxRetryError)
+                self._log_request(
+                    method,
+                    url,
+                    start,
+                    request=exc.request,
+                    retries=self._config.max_retries if exhausted else 0,
+                    error=type(exc).__name__,
+                )
+            raise
+        if self._request_log:
+            history = getattr(getattr(response.raw, "retries", None), "history", None) or ()
+            self._log_request(method, url, start, request=response.request, response=response, retries=len(history))
         return response
 
+    def _log_request(
+        self,
+        method: str,
+        url: str,
+        start: float,
+        *,
+        request: Optional[PreparedRequest] = None,
+        response: Optional[Response] = None,
+        retries: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        body = request.body if request is not None else None
+        # Tests that never call log_test_name are still identified by their pytest node id
+        test_name = TcLogger.get_log().test_name or os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0] or None
+        record: Dict[str, Any] = {
+            "ts": round(time.time(), 3),
+            "test": test_name,
+            "method": method.upper(),
+            "url": url,
+            "status": response.status_code if response is not None else None,
+            "ms": round((time.perf_counter() - start) * 1000, 2),
+            "req_bytes": len(body) if body else 0,
+            "resp_bytes": len(response.content or b"") if response is not None else 0,
+            "retries": retries,
+        }
+        if error:
+            record["error"] = error
+        self._request_log.write(record)
+
     def get(self, path: str, **kwargs: Any) -> Response:
         return self.request("GET", path, **kwargs)
 
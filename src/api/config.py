@@ -12,3 +12,7 @@ class ClientConfig:
     api_key: Optional[str] = None
     default_headers: Dict[str, str] = field(default_factory=dict)
     log_level: str = "INFO"
+    # Structured JSONL request log (see modules.request_log); disabled when None
+    request_log_dir: Optional[str] = None
+    request_log_max_bytes: int = 50 * 1024 * 1024
+    request_log_backup_count: int = 10
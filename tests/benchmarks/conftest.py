@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+from modules.benchmark import (
+    DEFAULT_SIGMAS,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_regressions,
+    load_runs,
+    measure,
+    save_results,
+)
+from src.api.client import ApiClient
+from src.api.config import ClientConfig
+from tests.benchmarks.helpers import MEMORY_BASE_URL, PAYLOAD_SIZES, LoopbackHandler, encode_payload
+from tests.helpers import MemoryAdapter
+
+
+_results_key = pytest.StashKey[List[Dict[str, Any]]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_results_key] = []
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    results = session.config.stash.get(_results_key, [])
+    if not results:
+        return
+
+    reports_dir = Path(os.getenv("BENCH_REPORTS_DIR", os.path.join("reports", "benchmarks"))).resolve()
+    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    path = save_results(results, reports_dir / f"benchmark_{ts}.json")
+    save_results(results, reports_dir / "latest.json")
+    logging.getLogger(__name__).info("Benchmark results saved to %s", path)
+
+    # Result files and/or directories of earlier runs, separated like PATH
+    baseline = [Path(path) for path in os.getenv("BENCH_BASELINE", "").split(os.pathsep) if path]
+    if not baseline:
+        return
+    threshold = float(os.getenv("BENCH_THRESHOLD", str(DEFAULT_THRESHOLD)))
+    sigmas = float(os.getenv("BENCH_SIGMAS", str(DEFAULT_SIGMAS)))
+    current = {item["name"]: item for item in results}
+    regressions = compare_results(load_runs(baseline), [current], threshold, sigmas)
+    print(format_regressions(regressions, threshold))
+    if regressions:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.fixture(autouse=True)
+def quiet_client_logs() -> Iterator[None]:
+    # Per-request INFO lines would flood stdout; the level check itself is still timed.
+    client_logger = logging.getLogger(ApiClient.__module__)
+    previous = client_logger.level
+    client_logger.setLevel(logging.WARNING)
+    yield
+    client_logger.setLevel(previous)
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Callable[..., Dict[str, Any]]:
+    """
+    Time a callable and record the result under the test's name (plus optional suffix).
+    `threshold` overrides BENCH_THRESHOLD for benchmarks that are noisier by nature.
+    Returns the recorded entry so tests can attach extra fields to it.
+    """
+    results = request.config.stash[_results_key]
+
+    def run(
+        func: Callable[[], Any],
+        *,
+        name: str = "",
+        threshold: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        stats = measure(func, **kwargs)
+        full_name = request.node.name + (f"[{name}]" if name else "")
+        entry: Dict[str, Any] = {"name": full_name, **stats}
+        if threshold is not None:
+            entry["threshold"] = threshold
+        results.append(entry)
+        return entry
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def loopback_url() -> Iterator[str]:
+    LoopbackHandler.payloads = {name: encode_payload(items) for name, items in PAYLOAD_SIZES.items()}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LoopbackHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loopback_client(loopback_url: str) -> ApiClient:
+    return ApiClient(ClientConfig(base_url=loopback_url, max_retries=0))
+
+
+@pytest.fixture
+def memory_client() -> ApiClient:
+    client = ApiClient(ClientConfig(base_url=MEMORY_BASE_URL, api_key="bench-token", max_retries=0))
+    # ApiClient does not expose its session; mounting on the exact host keeps the real adapters intact.
+    client._session.mount(MEMORY_BASE_URL, MemoryAdapter())
+    return client
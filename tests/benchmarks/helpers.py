@@ -0,0 +1,62 @@
+import json
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Dict, List
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+from src.api.client import ApiClient
+
+
+PAYLOAD_SIZES = {"small": 10, "medium": 1_000, "large": 10_000}
+MEMORY_BASE_URL = "http://bench.invalid"
+
+
+def make_payload(items: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": index, "name": f"user-{index}", "active": index % 2 == 0, "score": index * 1.5, "tags": ["a", "b"]}
+        for index in range(items)
+    ]
+
+
+def encode_payload(items: int) -> bytes:
+    return json.dumps(make_payload(items)).encode("utf-8")
+
+
+class LoopbackHandler(BaseHTTPRequestHandler):
+    """
+    Minimal keep-alive JSON server: GET /json/<size> returns a payload from PAYLOAD_SIZES,
+    any other GET returns {"ok": true} and POST echoes the request body.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY delayed ACKs add ~40ms per request
+    disable_nagle_algorithm = True
+    payloads: Dict[str, bytes] = {}
+
+    def _send(self, body: bytes, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        name = self.path.strip("/").split("/")[-1]
+        self._send(self.payloads.get(name, b'{"ok": true}'))
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self._send(self.rfile.read(length) or b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def size_pool(client: ApiClient, url: str, connections: int) -> None:
+    """
+    Remount the adapter for `url` with room for `connections` pooled connections, so
+    concurrent benchmarks reuse keep-alive connections instead of discarding them.
+    """
+    adapter = client._session.get_adapter(url)
+    pool_size = max(connections, DEFAULT_POOLSIZE)
+    client._session.mount(url, HTTPAdapter(pool_maxsize=pool_size, max_retries=adapter.max_retries))
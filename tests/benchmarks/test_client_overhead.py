@@ -0,0 +1,57 @@
+import pytest
+
+from modules.logger import redact_headers
+from src.api.base_api import BaseApi
+from src.api.client import ApiClient
+
+
+pytestmark = pytest.mark.benchmark
+
+HEADERS = {"Authorization": "Bearer token", "Accept": "application/json", "X-Request-Id": "abc-123"}
+# Sub-microsecond calls swing 20-60% between runs of the same code
+MICRO_THRESHOLD = 0.5
+
+
+def test_url_relative(bench, memory_client: ApiClient) -> None:
+    bench(lambda: memory_client._url("/users/42"), rounds=200, inner=100, threshold=MICRO_THRESHOLD)
+
+
+def test_url_absolute(bench, memory_client: ApiClient) -> None:
+    bench(lambda: memory_client._url("https://example.com/users/42"), rounds=200, inner=100, threshold=MICRO_THRESHOLD)
+
+
+def test_redact_headers(bench) -> None:
+    bench(lambda: redact_headers(HEADERS), rounds=200, inner=100, threshold=MICRO_THRESHOLD)
+
+
+def test_base_api_full_path(bench, memory_client: ApiClient) -> None:
+    users = BaseApi(memory_client, "/users")
+    bench(lambda: users._full_path("42"), rounds=200, inner=100, threshold=MICRO_THRESHOLD)
+
+
+def test_memory_get(bench, memory_client: ApiClient) -> None:
+    stats = bench(lambda: memory_client.get("/status/200", headers={"X-Request-Id": "abc"}), rounds=200)
+    assert stats["median_s"] > 0
+
+
+def test_memory_post_json(bench, memory_client: ApiClient) -> None:
+    payload = {"hello": "world", "items": list(range(20))}
+    bench(lambda: memory_client.post("/anything", json=payload), rounds=200)
+
+
+def test_memory_base_api_get(bench, memory_client: ApiClient) -> None:
+    users = BaseApi(memory_client, "/users")
+    bench(lambda: users.get("42", params={"expand": "roles"}), rounds=200)
+
+
+def test_loopback_get(bench, loopback_client: ApiClient) -> None:
+    response = loopback_client.get("/status/200")
+    assert response.status_code == 200
+    # Loopback timings include the server thread and the kernel, so they get a wider threshold
+    bench(lambda: loopback_client.get("/status/200"), rounds=200, threshold=0.5)
+
+
+def test_loopback_post_json(bench, loopback_client: ApiClient) -> None:
+    payload = {"hello": "world", "items": list(range(20))}
+    assert loopback_client.post_json("/anything", json=payload) == payload
+    bench(lambda: loopback_client.post("/anything", json=payload), rounds=200, threshold=0.5)
@@ -0,0 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.api.client import ApiClient
+from tests.benchmarks.helpers import size_pool
+
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS_PER_ROUND = 200
+
+
+@pytest.mark.parametrize("workers", [1, 4, 16])
+def test_loopback_throughput(bench, loopback_url: str, loopback_client: ApiClient, workers: int) -> None:
+    # The default pool holds 10 connections; beyond that every burst would measure connection churn
+    size_pool(loopback_client, loopback_url, workers)
+
+    def burst():
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(lambda _: loopback_client.get("/status/200"), range(REQUESTS_PER_ROUND)))
+        assert all(response.status_code == 200 for response in responses)
+
+    # Timed as seconds per burst so that "slower" means the same thing for every benchmark
+    entry = bench(burst, rounds=10, warmup=1, threshold=0.5)
+    entry["requests_per_s"] = REQUESTS_PER_ROUND / entry["median_s"]
@@ -0,0 +1,51 @@
+import pytest
+
+from src.api.base_api import BaseApi
+from src.api.client import ApiClient
+from src.api.config import ClientConfig
+from tests.benchmarks.helpers import MEMORY_BASE_URL, PAYLOAD_SIZES, encode_payload
+from tests.helpers import MemoryAdapter
+
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = {"small": 200, "medium": 100, "large": 30}
+
+
+@pytest.fixture(params=list(PAYLOAD_SIZES))
+def payload_api(request: pytest.FixtureRequest, memory_client: ApiClient):
+    size = request.param
+    memory_client._session.mount(MEMORY_BASE_URL, MemoryAdapter(encode_payload(PAYLOAD_SIZES[size])))
+    users = BaseApi(memory_client, "/users")
+    return size, users, users.get()
+
+
+def test_decode(bench, payload_api) -> None:
+    size, users, response = payload_api
+
+    def decode():
+        # Response does not cache .json(), so every call parses the body again
+        return users.get_response_json(response)
+
+    assert len(decode()) == PAYLOAD_SIZES[size]
+    bench(decode, rounds=ROUNDS[size])
+
+
+def test_decode_and_validate(bench, payload_api) -> None:
+    size, users, response = payload_api
+
+    def decode_and_validate():
+        assert users.is_array(response)
+        for item in users.get_response_json(response):
+            assert users.validate_params(item, "id", "name", "active")
+            assert users.validate_types(item, id=int, name=str, active=bool, score=float)
+
+    decode_and_validate()
+    bench(decode_and_validate, rounds=ROUNDS[size])
+
+
+@pytest.mark.parametrize("size", list(PAYLOAD_SIZES))
+def test_get_and_decode_loopback(bench, loopback_url: str, size: str) -> None:
+    client = ApiClient(ClientConfig(base_url=loopback_url, max_retries=0))
+    assert len(client.get_json(f"/json/{size}")) == PAYLOAD_SIZES[size]
+    bench(lambda: client.get_json(f"/json/{size}"), rounds=ROUNDS[size], threshold=0.5)
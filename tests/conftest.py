@@ -1,6 +1,7 @@
 import os
 import json
 import pytest
+from typing import Iterator
 from dotenv import load_dotenv
 
 from modules.logger import TcLogger
@@ -8,6 +9,11 @@ from src.api.client import ApiClient
 from src.api.config import ClientConfig
 
 
+# modules.timings records test durations under reports/ and provides --shard-count/--shard-id/--timings-order;
+# pytester runs throwaway suites in the plugin's own tests
+pytest_plugins = ["modules.timings", "pytester"]
+
+
 @pytest.fixture(scope="session", autouse=True)
 def load_env() -> None:
     # Load variables from a .env file if present
@@ -24,6 +30,14 @@ def enable_file_logging() -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_test_name() -> Iterator[None]:
+    # A test that does not call log_test_name must not inherit the previous test's name
+    TcLogger.get_log().clear_test_name()
+    yield
+    TcLogger.get_log().clear_test_name()
+
+
 @pytest.fixture(scope="session")
 def base_url() -> str:
     return os.getenv("API_BASE_URL", "https://httpbin.org")
@@ -48,5 +62,8 @@ def api_client(base_url: str) -> ApiClient:
         api_key=os.getenv("API_TOKEN"),
         default_headers=default_headers,
         log_level=os.getenv("API_LOG_LEVEL", "INFO"),
+        request_log_dir=os.getenv("API_REQUEST_LOG_DIR") or None,
+        request_log_max_bytes=int(os.getenv("API_REQUEST_LOG_MAX_BYTES", str(50 * 1024 * 1024))),
+        request_log_backup_count=int(os.getenv("API_REQUEST_LOG_BACKUPS", "10")),
     )
     return ApiClient(config)
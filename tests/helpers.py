@@ -0,0 +1,34 @@
+"""
+Helpers shared by the unit tests and benchmarks.
+"""
+
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class MemoryAdapter(BaseAdapter):
+    """
+    Transport adapter answering every request with a canned JSON body, so ApiClient
+    can be exercised without sockets or a server.
+    """
+
+    def __init__(self, body: bytes = b'{"ok": true}', status_code: int = 200) -> None:
+        super().__init__()
+        self._body = body
+        self._status_code = status_code
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        response = Response()
+        response.status_code = self._status_code
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = self._body
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
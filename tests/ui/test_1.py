@@ -8,6 +8,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'modules'))
 from logger import get_logger  # type: ignore
 
 
+pytestmark = pytest.mark.ui
+
+
 def test_navigate_to_acme_with_auth(page):
     """
     Test navigating to the ACME page using saved authentication state.
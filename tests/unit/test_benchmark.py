@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+from modules.benchmark import compare_results, load_results, load_runs, main, measure, save_results
+
+
+def _result(name: str, relative: float, relative_stdev: float = 0.0, **extra) -> dict:
+    return {"name": name, "relative": relative, "relative_stdev": relative_stdev, "median_s": relative, **extra}
+
+
+def test_measure_reports_per_call_stats() -> None:
+    calls = []
+    stats = measure(lambda: calls.append(1), rounds=10, warmup=2, inner=3, repeats=5)
+    assert len(calls) == 2 + 10 * 3
+    assert stats["rounds"] == 10 and stats["repeats"] == 5
+    assert 0 <= stats["min_s"] <= stats["median_s"] <= stats["max_s"]
+    assert stats["relative"] > 0 and stats["relative_stdev"] >= 0
+
+
+def _run(**relatives: float) -> dict:
+    return {name: _result(name, relative) for name, relative in relatives.items()}
+
+
+def test_compare_flags_only_regressions_above_threshold() -> None:
+    baseline = {"fast": _result("fast", 1.0), "slow": _result("slow", 1.0), "gone": _result("gone", 1.0)}
+    current = {"fast": _result("fast", 0.5), "slow": _result("slow", 1.5), "new": _result("new", 9.0)}
+    regressions = compare_results([baseline], [current], threshold=0.2)
+    assert [item["name"] for item in regressions] == ["slow"]
+    assert round(regressions[0]["change"], 2) == 0.5
+
+
+def test_compare_single_runs_use_within_run_noise() -> None:
+    baseline = {
+        "noisy": _result("noisy", 1.0, relative_stdev=0.1),
+        "steady": _result("steady", 1.0, relative_stdev=0.01),
+    }
+    current = {
+        "noisy": _result("noisy", 1.25, relative_stdev=0.05),
+        "steady": _result("steady", 1.25, relative_stdev=0.01),
+    }
+    regressions = compare_results([baseline], [current], threshold=0.2, sigmas=3.0)
+    assert [item["name"] for item in regressions] == ["steady"]
+
+
+def test_compare_uses_noise_between_runs() -> None:
+    # Same code measured 1.0-1.4 across baseline runs: a 1.35 run is not a regression
+    baseline = [_run(a=1.0, b=1.0), _run(a=1.4, b=1.02), _run(a=1.1, b=0.98)]
+    assert compare_results(baseline, [_run(a=1.35, b=1.0)], threshold=0.2) == []
+    # Every current run must be slower than the slowest baseline run
+    assert compare_results(baseline, [_run(a=2.0, b=1.5), _run(a=1.3, b=1.4)], threshold=0.2) == [
+        {"name": "b", "baseline_s": 1.02, "current_s": 1.4, "change": (1.4 - 1.02) / 1.02}
+    ]
+
+
+def test_compare_uses_per_benchmark_threshold() -> None:
+    baseline = [{"loopback": _result("loopback", 1.0)}]
+    assert compare_results(baseline, [{"loopback": _result("loopback", 1.4, threshold=0.5)}], threshold=0.2) == []
+    assert compare_results(baseline, [{"loopback": _result("loopback", 1.6, threshold=0.5)}], threshold=0.2)
+
+
+def test_load_runs_expands_directories(tmp_path: Path) -> None:
+    save_results([_result("a", 1.0)], tmp_path / "runs" / "benchmark_1.json")
+    save_results([_result("a", 1.1)], tmp_path / "runs" / "benchmark_2.json")
+    save_results([_result("a", 1.1)], tmp_path / "runs" / "latest.json")
+    single = save_results([_result("a", 1.2)], tmp_path / "single.json")
+    runs = load_runs([tmp_path / "runs", single])
+    assert [run["a"]["relative"] for run in runs] == [1.0, 1.1, 1.2]
+
+
+def test_compare_cli_exit_code(tmp_path: Path) -> None:
+    baseline = save_results([_result("a", 1.0)], tmp_path / "baseline.json")
+    current = save_results([_result("a", 1.1)], tmp_path / "current.json")
+    assert load_results(current)["a"]["relative"] == 1.1
+    assert json.loads(current.read_text())["results"][0]["name"] == "a"
+    args = ["compare", "--baseline", str(baseline), "--current", str(current)]
+    assert main(args + ["--threshold", "0.2"]) == 0
+    assert main(args + ["--threshold", "0.05"]) == 1
+    (tmp_path / "empty").mkdir()
+    assert main(["compare", "--baseline", str(tmp_path / "empty"), "--current", str(current)]) == 2
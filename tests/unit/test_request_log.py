@@ -0,0 +1,152 @@
+import gzip
+import json
+import socket
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+import requests
+
+from modules.logger import TcLogger
+from modules.request_log import RequestLogSink, analyze, get_request_log_sink, main, normalize_endpoint
+from src.api.client import ApiClient
+from src.api.config import ClientConfig
+from tests.helpers import MemoryAdapter
+
+
+def _read_lines(directory: Path) -> list:
+    lines = []
+    for path in sorted(directory.iterdir()):
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as stream:
+            lines.extend(json.loads(line) for line in stream)
+    return lines
+
+
+@pytest.fixture
+def request_log_dir(tmp_path: Path) -> Iterator[Path]:
+    yield tmp_path
+    # Only this test's sink is closed; other clients' sinks stay open
+    get_request_log_sink(str(tmp_path)).close()
+    TcLogger.get_log().clear_test_name()
+
+
+def _client(base_url: str, log_dir: Path, **config: Any) -> ApiClient:
+    return ApiClient(ClientConfig(base_url=base_url, request_log_dir=str(log_dir), **config))
+
+
+def test_client_writes_one_record_per_request(request_log_dir: Path) -> None:
+    client = _client("http://mem.invalid", request_log_dir, max_retries=0)
+    client._session.mount("http://mem.invalid", MemoryAdapter(status_code=404))
+    TcLogger.get_log().log_test_name("test_client_writes_one_record_per_request")
+    client.post("/users/42", json={"name": "x"})
+    get_request_log_sink(str(request_log_dir)).close()
+
+    [record] = _read_lines(request_log_dir)
+    assert record["test"] == "test_client_writes_one_record_per_request"
+    assert record["method"] == "POST"
+    assert record["url"] == "http://mem.invalid/users/42"
+    assert record["status"] == 404
+    assert record["req_bytes"] == len(b'{"name": "x"}')
+    assert record["resp_bytes"] == len(b'{"ok": true}')
+    assert record["retries"] == 0
+    assert record["ms"] >= 0
+
+
+def test_client_falls_back_to_pytest_node_id(request_log_dir: Path) -> None:
+    client = _client("http://mem.invalid", request_log_dir, max_retries=0)
+    client._session.mount("http://mem.invalid", MemoryAdapter())
+    client.get("/status")
+    get_request_log_sink(str(request_log_dir)).close()
+
+    [record] = _read_lines(request_log_dir)
+    assert record["test"] == "tests/unit/test_request_log.py::test_client_falls_back_to_pytest_node_id"
+
+
+def test_client_logs_failed_request_with_retries(request_log_dir: Path) -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    # Nothing listens on the port any more, so every attempt is refused
+    client = _client(f"http://127.0.0.1:{port}", request_log_dir, max_retries=2, backoff_factor=0)
+    with pytest.raises(requests.ConnectionError):
+        client.post("/users", json={"name": "x"})
+    get_request_log_sink(str(request_log_dir)).close()
+
+    [record] = _read_lines(request_log_dir)
+    assert record["status"] is None
+    assert record["error"] == "ConnectionError"
+    assert record["retries"] == 2
+    assert record["req_bytes"] == len(b'{"name": "x"}')
+    assert record["resp_bytes"] == 0
+
+
+def test_sink_rotates_compresses_and_prunes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    sink = RequestLogSink(str(tmp_path), max_bytes=200, backup_count=2)
+    for index in range(30):
+        sink.write({"method": "GET", "url": f"/items/{index}", "status": 200, "ms": 1.0})
+    sink.close()
+
+    archives = sorted(tmp_path.glob("requests.*.jsonl.gz"))
+    assert len(archives) == 2
+    # close() waits for background compression: no partial or uncompressed archives remain
+    assert sorted(path.name for path in tmp_path.glob("*.jsonl")) == ["requests.jsonl"]
+    assert not list(tmp_path.glob("*.partial"))
+    assert sink.path.stat().st_size <= 200
+    assert len(_read_lines(tmp_path)) < 30
+
+
+def test_sink_uses_one_file_per_xdist_worker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    assert RequestLogSink(str(tmp_path)).path.name == "requests-gw1.jsonl"
+
+
+def test_sinks_sharing_a_file_keep_every_line(tmp_path: Path) -> None:
+    # Stands in for two processes appending to and rotating the same file
+    first = RequestLogSink(str(tmp_path), max_bytes=300, backup_count=100, name="requests")
+    second = RequestLogSink(str(tmp_path), max_bytes=300, backup_count=100, name="requests")
+    for index in range(40):
+        (first if index % 2 else second).write({"method": "GET", "url": f"/items/{index}", "ms": 1.0})
+    first.close()
+    second.close()
+
+    assert sorted(int(line["url"].rsplit("/", 1)[1]) for line in _read_lines(tmp_path)) == list(range(40))
+    assert all(path.stat().st_size <= 300 for path in tmp_path.glob("*.jsonl"))
+
+
+def test_shared_sink_warns_about_different_settings(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    sink = get_request_log_sink(str(tmp_path), max_bytes=1000, backup_count=2)
+    try:
+        assert get_request_log_sink(str(tmp_path), max_bytes=1000, backup_count=2) is sink
+        assert not caplog.records
+        assert get_request_log_sink(str(tmp_path), max_bytes=2000, backup_count=2) is sink
+        assert "ignoring max_bytes=2000" in caplog.text
+    finally:
+        sink.close()
+
+
+def test_normalize_endpoint() -> None:
+    assert normalize_endpoint("https://api.test/users/42/orders?page=2") == "https://api.test/users/{id}/orders"
+    assert normalize_endpoint("/docs/3fa85f64-5717-4562-b3fc-2c963f66afa6") == "/docs/{id}"
+
+
+def test_analyze_plain_and_gzipped_logs(tmp_path: Path, capsys) -> None:
+    records = [{"method": "GET", "url": f"/users/{index}", "status": 200, "ms": 10.0} for index in range(9)]
+    records.append({"method": "GET", "url": "/users/9", "status": 500, "ms": 100.0, "retries": 2})
+    records.append({"method": "POST", "url": "/login", "status": None, "ms": 5.0, "error": "ConnectTimeout"})
+    (tmp_path / "requests.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records[:6]) + "not json\n")
+    with gzip.open(tmp_path / "requests.old.jsonl.gz", "wt") as stream:
+        stream.writelines(json.dumps(r) + "\n" for r in records[6:])
+
+    rows = {row["endpoint"]: row for row in analyze([tmp_path], jobs=2)}
+    users = rows["GET /users/{id}"]
+    assert users["count"] == 10
+    assert users["error_rate"] == 0.1
+    assert users["retries"] == 2
+    assert users["max_ms"] == 100.0
+    assert 10.0 <= users["p95_ms"] <= 100.0
+    assert rows["POST /login"]["error_rate"] == 1.0
+
+    assert main(["analyze", str(tmp_path), "--jobs", "1"]) == 0
+    assert "11 requests, 2 endpoints" in capsys.readouterr().out
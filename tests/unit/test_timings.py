@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pytest
+
+from modules.timings import estimate_durations, load_timings, main, partition, save_timings
+
+
+def test_partition_balances_and_orders_longest_first() -> None:
+    durations = {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0, "f": 0.1}
+    shards = partition(durations, 2)
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(durations)
+    totals = [sum(durations[nodeid] for nodeid in shard) for shard in shards]
+    assert abs(totals[0] - totals[1]) <= 4.0
+    for shard in shards:
+        assert [durations[nodeid] for nodeid in shard] == sorted((durations[n] for n in shard), reverse=True)
+
+
+def test_partition_is_deterministic_for_ties() -> None:
+    durations = {f"test_{index}": 1.0 for index in range(7)}
+    assert partition(durations, 3) == partition(dict(reversed(list(durations.items()))), 3)
+    assert [len(shard) for shard in partition(durations, 3)] == [3, 2, 2]
+
+
+def test_partition_with_more_shards_than_tests() -> None:
+    assert partition({"a": 1.0}, 3) == [["a"], [], []]
+
+
+def test_unknown_tests_get_median_duration() -> None:
+    estimated = estimate_durations(["known", "new"], {"known": 4.0, "other": 1.0, "third": 2.0})
+    assert estimated == {"known": 4.0, "new": 2.0}
+    assert estimate_durations(["new"], {}) == {"new": 1.0}
+
+
+def test_timings_roundtrip_and_merge(tmp_path: Path) -> None:
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    save_timings(first, {"a": 1.0, "b": 2.0})
+    save_timings(second, {"b": 3.0})
+    assert load_timings(tmp_path / "missing.json") == {}
+    assert main(["merge", str(first), str(second), "-o", str(tmp_path / "merged.json")]) == 0
+    assert load_timings(tmp_path / "merged.json") == {"a": 1.0, "b": 3.0}
+
+
+SUITE = """
+def test_slow():
+    pass
+
+def test_medium():
+    pass
+
+def test_fast():
+    pass
+
+def test_tiny():
+    pass
+"""
+RECORDED = {
+    "test_suite.py::test_slow": 8.0,
+    "test_suite.py::test_medium": 5.0,
+    "test_suite.py::test_fast": 4.0,
+    "test_suite.py::test_tiny": 2.0,
+}
+
+
+def _run_suite(pytester, *args: str):
+    pytester.makepyfile(test_suite=SUITE)
+    save_timings(pytester.path / "timings.json", RECORDED)
+    return pytester.inline_run("-p", "modules.timings", "--timings-file", "timings.json", *args)
+
+
+def _ran(reprec) -> list:
+    return [report.nodeid for report in reprec.getreports("pytest_runtest_logreport") if report.when == "call"]
+
+
+def test_plugin_runs_only_its_shard_longest_first(pytester) -> None:
+    first = _run_suite(pytester, "--shard-count", "2", "--shard-id", "0", "--no-record-timings")
+    assert _ran(first) == ["test_suite.py::test_slow", "test_suite.py::test_tiny"]
+    [deselected] = first.getcalls("pytest_deselected")
+    assert sorted(item.nodeid for item in deselected.items) == [
+        "test_suite.py::test_fast",
+        "test_suite.py::test_medium",
+    ]
+
+    second = _run_suite(pytester, "--shard-count", "2", "--shard-id", "1", "--no-record-timings")
+    assert _ran(second) == ["test_suite.py::test_medium", "test_suite.py::test_fast"]
+
+
+def test_plugin_orders_without_sharding(pytester) -> None:
+    reprec = _run_suite(pytester, "--timings-order", "--no-record-timings")
+    assert _ran(reprec) == [
+        "test_suite.py::test_slow",
+        "test_suite.py::test_medium",
+        "test_suite.py::test_fast",
+        "test_suite.py::test_tiny",
+    ]
+
+
+def test_plugin_merges_recorded_durations(pytester) -> None:
+    reprec = _run_suite(pytester, "--shard-count", "2", "--shard-id", "1")
+    reprec.assertoutcome(passed=2)
+    timings = load_timings(pytester.path / "timings.json")
+    assert set(timings) == set(RECORDED)
+    # Tests of this shard were re-measured (they do nothing), the other shard keeps its old values
+    assert timings["test_suite.py::test_medium"] < 1.0 and timings["test_suite.py::test_fast"] < 1.0
+    assert timings["test_suite.py::test_slow"] == 8.0 and timings["test_suite.py::test_tiny"] == 2.0
+
+
+def test_plugin_keeps_durations_of_skipped_tests(pytester) -> None:
+    pytester.makepyfile(
+        test_suite="""
+        import pytest
+
+        @pytest.mark.skip(reason="in setup")
+        def test_slow():
+            pass
+
+        def test_medium():
+            pytest.skip("in call")
+
+        def test_fast():
+            pass
+        """
+    )
+    save_timings(pytester.path / "timings.json", RECORDED)
+    pytester.inline_run("-p", "modules.timings", "--timings-file", "timings.json").assertoutcome(passed=1, skipped=2)
+    timings = load_timings(pytester.path / "timings.json")
+    assert timings["test_suite.py::test_slow"] == 8.0 and timings["test_suite.py::test_medium"] == 5.0
+    assert timings["test_suite.py::test_fast"] < 1.0
+
+
+def test_plugin_writes_separate_output(pytester) -> None:
+    _run_suite(pytester, "--timings-output", "shard.json")
+    assert load_timings(pytester.path / "timings.json") == RECORDED
+    assert set(load_timings(pytester.path / "shard.json")) == set(RECORDED)
+
+
+def test_plugin_rejects_invalid_shard_id(pytester) -> None:
+    pytester.makepyfile(test_suite=SUITE)
+    result = pytester.runpytest("-p", "modules.timings", "--shard-count", "2", "--shard-id", "2")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*--shard-id must be in [[]0, 2)*"])